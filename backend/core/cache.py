@@ -0,0 +1,78 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def feature_cache_key(pk):
+    """Cache key for a feature's serialized representation"""
+    return f"feature:{int(pk)}"
+
+
+def feature_generation_key(pk):
+    """Cache key for the token that invalidation replaces"""
+    return f"feature:{int(pk)}:generation"
+
+
+def get_feature_generation(pk):
+    """Return the feature's current cache generation, creating one if needed
+
+    Read this before loading the feature from the database and pass it to
+    ``cache_feature``, so data read before an invalidation is never served.
+    """
+    if not settings.FEATURE_CACHE_ENABLED:
+        return None
+    key = feature_generation_key(pk)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def get_cached_feature(pk):
+    """Return the cached representation of a feature, or None"""
+    if not settings.FEATURE_CACHE_ENABLED:
+        return None
+    key = feature_cache_key(pk)
+    generation_key = feature_generation_key(pk)
+    values = cache.get_many([key, generation_key])
+    entry = values.get(key)
+    if entry is None:
+        return None
+    if entry["generation"] != values.get(generation_key):
+        # Drop the outdated copy so the next read's cache_feature() can
+        # replace it; add() never overwrites an existing entry
+        cache.delete(key)
+        return None
+    return entry["data"]
+
+
+def cache_feature(pk, data, generation):
+    """Store a feature's representation unless a copy is already cached
+
+    ``generation`` is the value ``get_feature_generation`` returned before
+    ``data`` was read; if the feature was invalidated since, the entry is
+    ignored by ``get_cached_feature``.
+    """
+    if not settings.FEATURE_CACHE_ENABLED:
+        return
+    entry = {"generation": generation, "data": dict(data)}
+    cache.add(feature_cache_key(pk), entry, settings.FEATURE_CACHE_TIMEOUT)
+
+
+def invalidate_feature(pk):
+    """Drop a feature's cached representation
+
+    The generation is replaced and the entry deleted immediately and again
+    once the surrounding transaction commits, so a read that started before
+    either point cannot repopulate the cache with the data it loaded.
+    """
+
+    def invalidate():
+        cache.set(feature_generation_key(pk), uuid.uuid4().hex, None)
+        cache.delete(feature_cache_key(pk))
+
+    invalidate()
+    transaction.on_commit(invalidate)
@@ -0,0 +1,97 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.cache import invalidate_feature
+from core.models import ArchivedFeature, Board, Feature, FeatureTombstone
+
+ARCHIVED_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "summary",
+    "votes",
+    "created_at",
+    "updated_at",
+    "board_id",
+]
+
+
+class Command(BaseCommand):
+    help = "Move stale, low-vote features from the live table to the archive"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Archive features not updated for this many days (default: 365)",
+        )
+        parser.add_argument(
+            "--max-votes",
+            type=int,
+            default=0,
+            help="Only archive features with at most this many votes (default: 0)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of features moved per transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many features would be archived without moving them",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        stale = Feature.objects.filter(
+            updated_at__lt=cutoff, votes__lte=options["max_votes"]
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"{stale.count()} features would be archived.")
+            return
+
+        archived = 0
+        while True:
+            moved = self.archive_batch(stale, options["batch_size"])
+            if not moved:
+                break
+            archived += moved
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} features."))
+
+    def archive_batch(self, queryset, batch_size):
+        """Copy one batch into the archive and remove it from the live table"""
+        with transaction.atomic():
+            batch = list(
+                queryset.order_by("id").select_for_update(skip_locked=True)[:batch_size]
+            )
+            if not batch:
+                return 0
+
+            ids = [feature.id for feature in batch]
+            ArchivedFeature.objects.bulk_create(
+                ArchivedFeature(
+                    **{name: getattr(feature, name) for name in ARCHIVED_FIELDS}
+                )
+                for feature in batch
+            )
+            # A queryset delete skips Feature.delete(), so record the tombstones,
+            # board counts and cache invalidation here.
+            Feature.objects.filter(id__in=ids).delete()
+            FeatureTombstone.objects.bulk_create(
+                FeatureTombstone(feature_id=feature.id, board_id=feature.board_id)
+                for feature in batch
+            )
+            for board_id, moved in Counter(f.board_id for f in batch).items():
+                Board.adjust_feature_count(board_id, -moved)
+            for feature_id in ids:
+                invalidate_feature(feature_id)
+        return len(batch)
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.stress import StressHarness
+
+
+class Command(BaseCommand):
+    help = "Run a multi-threaded vote/create/update workload and check invariants"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=16,
+            help="Number of concurrent client threads (default: 16)",
+        )
+        parser.add_argument(
+            "--operations",
+            type=int,
+            default=2000,
+            help="Total number of requests to issue (default: 2000)",
+        )
+        parser.add_argument(
+            "--features",
+            type=int,
+            default=5,
+            help="Number of pool and floor features to vote on (default: 5)",
+        )
+        parser.add_argument(
+            "--titles",
+            type=int,
+            default=20,
+            help="Size of the shared title set creates race on (default: 20)",
+        )
+        parser.add_argument(
+            "--seed", type=int, help="Random seed for a reproducible workload"
+        )
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header for requests; must be in ALLOWED_HOSTS",
+        )
+
+    def handle(self, *args, **options):
+        harness = StressHarness(
+            threads=options["threads"],
+            operations=options["operations"],
+            features=options["features"],
+            titles=options["titles"],
+            seed=options["seed"],
+            host=options["host"],
+        )
+        report = harness.run()
+        self.stdout.write(report.format())
+        if report.violations:
+            raise CommandError(f"{len(report.violations)} invariant violations")
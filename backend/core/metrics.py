@@ -0,0 +1,24 @@
+from django.core.cache import cache
+
+METRIC_PREFIX = "metrics:"
+
+
+def increment(name, amount=1):
+    """Increment a named counter in the cache backend
+
+    Counters are shared between workers when the cache backend is, and are
+    per-process with the default local-memory cache.
+    """
+    key = METRIC_PREFIX + name
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # The counter was evicted between add() and incr()
+        cache.set(key, amount, None)
+
+
+def get_counters(names):
+    """Return the current value of each named counter"""
+    values = cache.get_many([METRIC_PREFIX + name for name in names])
+    return {name: values.get(METRIC_PREFIX + name, 0) for name in names}
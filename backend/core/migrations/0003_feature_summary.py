@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:45
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def populate_summaries(apps, schema_editor):
+    Feature = apps.get_model("core", "Feature")
+    features = Feature.objects.only("id", "description")
+    for feature in features.iterator(chunk_size=500):
+        feature.summary = Truncator(feature.description).chars(200)
+        feature.save(update_fields=["summary"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_feature_changes_feed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feature",
+            name="summary",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Truncated description for card views",
+                max_length=200,
+            ),
+        ),
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:51
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_feature_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedFeature",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="Feature title (minimum 5 characters)",
+                        max_length=200,
+                        validators=[django.core.validators.MinLengthValidator(5)],
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(help_text="Detailed feature description"),
+                ),
+                (
+                    "summary",
+                    models.CharField(
+                        blank=True,
+                        editable=False,
+                        help_text="Truncated description for card views",
+                        max_length=200,
+                    ),
+                ),
+                ("votes", models.IntegerField(default=0, help_text="Number of votes")),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-votes", "-created_at"],
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def assign_default_board(apps, schema_editor):
+    Board = apps.get_model("core", "Board")
+    Feature = apps.get_model("core", "Feature")
+    ArchivedFeature = apps.get_model("core", "ArchivedFeature")
+    FeatureTombstone = apps.get_model("core", "FeatureTombstone")
+
+    board, _ = Board.objects.get_or_create(slug="default", defaults={"name": "Default"})
+    Feature.objects.filter(board__isnull=True).update(board=board)
+    ArchivedFeature.objects.filter(board__isnull=True).update(board=board)
+    FeatureTombstone.objects.filter(board__isnull=True).update(board=board)
+
+    counts = Feature.objects.values("board").annotate(total=Count("id"))
+    for row in counts:
+        Board.objects.filter(pk=row["board"]).update(feature_count=row["total"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_archived_feature"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Board",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(help_text="Board display name", max_length=100),
+                ),
+                ("slug", models.SlugField(help_text="URL identifier", unique=True)),
+                (
+                    "feature_count",
+                    models.PositiveIntegerField(
+                        default=0, editable=False, help_text="Number of live features"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="archivedfeature",
+            name="board",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.CASCADE, to="core.board"
+            ),
+        ),
+        migrations.AddField(
+            model_name="feature",
+            name="board",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.CASCADE, to="core.board"
+            ),
+        ),
+        migrations.AddField(
+            model_name="featuretombstone",
+            name="board",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.CASCADE, to="core.board"
+            ),
+        ),
+        migrations.RunPython(assign_default_board, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:53
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_boards"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedfeature",
+            name="board",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="core.board"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="feature",
+            name="board",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="core.board"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedfeature",
+            index=models.Index(
+                fields=["board", "-votes", "-created_at"],
+                name="core_archiv_board_i_b8d117_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feature",
+            index=models.Index(
+                fields=["board", "-votes", "-created_at"],
+                name="core_featur_board_i_ccb322_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feature",
+            index=models.Index(
+                fields=["board", "-created_at"], name="core_featur_board_i_00208b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feature",
+            index=models.Index(
+                fields=["board", "updated_at"], name="core_featur_board_i_a7d427_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="feature",
+            constraint=models.UniqueConstraint(
+                models.F("board"),
+                django.db.models.functions.text.Lower("title"),
+                name="core_feature_board_title_uniq",
+                violation_error_message="A feature with this title already exists.",
+            ),
+        ),
+    ]
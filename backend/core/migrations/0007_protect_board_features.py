@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_board_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedfeature",
+            name="board",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT, to="core.board"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="feature",
+            name="board",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT, to="core.board"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="featuretombstone",
+            name="board",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.SET_NULL, to="core.board"
+            ),
+        ),
+    ]
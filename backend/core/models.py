@@ -1,33 +1,166 @@
 from django.core.validators import MinLengthValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest, Lower
+from django.utils import timezone
+from django.utils.text import Truncator
 
+from .cache import invalidate_feature
+
+SUMMARY_LENGTH = 200
+DEFAULT_BOARD_SLUG = "default"
+
+
+class Board(models.Model):
+    """A product team's board; every feature belongs to exactly one board"""
+
+    name = models.CharField(max_length=100, help_text="Board display name")
+    slug = models.SlugField(max_length=50, unique=True, help_text="URL identifier")
+    feature_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Number of live features"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def get_default(cls):
+        """Return the board used by the unscoped ``/v1/features/`` routes"""
+        board, _ = cls.objects.get_or_create(
+            slug=DEFAULT_BOARD_SLUG, defaults={"name": "Default"}
+        )
+        return board
+
+    @classmethod
+    def adjust_feature_count(cls, board_id, delta):
+        """Atomically add ``delta`` to a board's live feature count"""
+        cls.objects.filter(pk=board_id).update(feature_count=F("feature_count") + delta)
+
+
+class AbstractFeature(models.Model):
+    """Columns shared by live and archived features"""
 
-class Feature(models.Model):
     title = models.CharField(
         max_length=200,
         validators=[MinLengthValidator(5)],
         help_text="Feature title (minimum 5 characters)",
     )
     description = models.TextField(help_text="Detailed feature description")
+    summary = models.CharField(
+        max_length=SUMMARY_LENGTH,
+        blank=True,
+        editable=False,
+        help_text="Truncated description for card views",
+    )
     votes = models.IntegerField(default=0, help_text="Number of votes")
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
+        abstract = True
         ordering = ["-votes", "-created_at"]
+
+    def __str__(self):
+        return f"{self.title} ({self.votes} votes)"
+
+
+class Feature(AbstractFeature):
+    board = models.ForeignKey(Board, on_delete=models.PROTECT)
+
+    class Meta(AbstractFeature.Meta):
         indexes = [
             models.Index(fields=["-votes", "-created_at"]),
+            models.Index(fields=["board", "-votes", "-created_at"]),
+            models.Index(fields=["board", "-created_at"]),
+            models.Index(fields=["board", "updated_at"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                "board",
+                Lower("title"),
+                name="core_feature_board_title_uniq",
+                violation_error_message="A feature with this title already exists.",
+            ),
         ]
 
-    def __str__(self):
-        return f"{self.title} ({self.votes} votes)"
+    def save(self, *args, **kwargs):
+        self.summary = Truncator(self.description).chars(SUMMARY_LENGTH)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "description" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "summary"}
+        if self.board_id is None:
+            self.board = Board.get_default()
+
+        if self._state.adding:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                Board.adjust_feature_count(self.board_id, 1)
+        else:
+            super().save(*args, **kwargs)
+        invalidate_feature(self.pk)
+
+    def delete(self, *args, **kwargs):
+        """Delete the feature and leave a tombstone for the changes feed"""
+        feature_id = self.pk
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            FeatureTombstone.objects.create(
+                feature_id=feature_id, board_id=self.board_id
+            )
+            Board.adjust_feature_count(self.board_id, -1)
+        invalidate_feature(feature_id)
+        return result
+
+    def _apply_vote(self, votes):
+        """Atomically update the vote count in the database and reload it"""
+        Feature.objects.filter(pk=self.pk).update(
+            votes=votes, updated_at=timezone.now()
+        )
+        invalidate_feature(self.pk)
+        self.refresh_from_db(fields=["votes", "updated_at"])
 
     def upvote(self):
         """Increment vote count"""
-        self.votes += 1
-        self.save(update_fields=["votes"])
+        self._apply_vote(F("votes") + 1)
 
     def downvote(self):
         """Decrement vote count (minimum 0)"""
-        self.votes = max(0, self.votes - 1)
-        self.save(update_fields=["votes"])
+        self._apply_vote(Greatest(F("votes") - 1, 0))
+
+
+class FeatureTombstone(models.Model):
+    """Record of a deleted feature, served by the changes feed"""
+
+    feature_id = models.BigIntegerField(help_text="ID of the deleted feature")
+    # Deletions stay in the global changes feed after their board is gone
+    board = models.ForeignKey(Board, null=True, on_delete=models.SET_NULL)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["deleted_at"]
+
+    def __str__(self):
+        return f"Feature {self.feature_id} deleted at {self.deleted_at}"
+
+
+class ArchivedFeature(AbstractFeature):
+    """Cold-tier copy of a stale feature, moved by ``archive_features``
+
+    Archived rows keep their original primary key and timestamps, and their
+    leading columns line up with ``Feature`` so both tiers can be combined
+    with a UNION query.
+    """
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    board = models.ForeignKey(Board, on_delete=models.PROTECT)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta(AbstractFeature.Meta):
+        indexes = [
+            models.Index(fields=["board", "-votes", "-created_at"]),
+        ]
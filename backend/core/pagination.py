@@ -0,0 +1,22 @@
+from django.core.paginator import Paginator
+from rest_framework.pagination import PageNumberPagination
+
+
+class CountedPaginator(Paginator):
+    """Paginator that can be handed a row count computed elsewhere"""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            self.count = count
+
+
+class FeaturePagination(PageNumberPagination):
+    """Page number pagination that reuses the view's ``row_count``, if set"""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        count = getattr(view, "row_count", None)
+        self.django_paginator_class = lambda *args, **kwargs: CountedPaginator(
+            *args, count=count, **kwargs
+        )
+        return super().paginate_queryset(queryset, request, view)
@@ -1,17 +1,49 @@
 from rest_framework import serializers
 
-from .models import Feature
+from .models import Board, Feature
+
+
+class BoardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Board
+        fields = ["id", "name", "slug", "feature_count", "created_at"]
+        read_only_fields = ["id", "feature_count", "created_at"]
 
 
 class FeatureSerializer(serializers.ModelSerializer):
     class Meta:
         model = Feature
-        fields = ["id", "title", "description", "votes", "created_at", "updated_at"]
-        read_only_fields = ["id", "votes", "created_at", "updated_at"]
+        fields = [
+            "id",
+            "board",
+            "title",
+            "description",
+            "summary",
+            "votes",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = [
+            "id",
+            "board",
+            "summary",
+            "votes",
+            "created_at",
+            "updated_at",
+        ]
+
+    def __init__(self, *args, **kwargs):
+        """Accept an optional ``fields`` list to serialize a sparse fieldset"""
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
     def validate_title(self, value):
-        """Ensure title is unique (case-insensitive)"""
-        if Feature.objects.filter(title__iexact=value).exists():
+        """Ensure title is unique within its board (case-insensitive)"""
+        board = self.instance.board if self.instance else self.context.get("board")
+        if Feature.objects.filter(board=board, title__iexact=value).exists():
             if self.instance and self.instance.title.lower() != value.lower():
                 raise serializers.ValidationError(
                     "A feature with this title already exists."
@@ -35,3 +67,11 @@ class FeatureUpdateSerializer(FeatureSerializer):
 
     class Meta(FeatureSerializer.Meta):
         fields = ["title", "description"]
+
+    def update(self, instance, validated_data):
+        # Write only the edited columns so a concurrent vote is not
+        # overwritten with the stale count loaded by get_object()
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
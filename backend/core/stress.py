@@ -0,0 +1,376 @@
+"""Multi-threaded stress harness for the feature write path
+
+Drives the board-scoped ``FeatureViewSet`` routes through the full Django
+stack from many threads against the configured database, then checks the
+invariants the write path must preserve. Used by the ``stress_test``
+management command and the integration tests.
+"""
+
+import logging
+import random
+import statistics
+import threading
+import time
+from bisect import bisect
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import Lower
+from django.test import Client, override_settings
+from django.utils.crypto import get_random_string
+
+from .cache import get_cached_feature
+from .models import Board, Feature
+
+DEFAULT_MIX = {
+    "upvote": 40,
+    "downvote": 15,
+    "create": 15,
+    "update": 10,
+    "retrieve": 15,
+    "list": 5,
+}
+
+
+class StressReport:
+    """Outcome of a stress run: throughput, latencies, lock waits, violations"""
+
+    def __init__(self, duration, results, lock_samples, deadlocks, violations):
+        self.duration = duration
+        self.results = results
+        self.lock_samples = lock_samples
+        self.deadlocks = deadlocks
+        self.violations = violations
+
+    @property
+    def operations(self):
+        return len(self.results)
+
+    @property
+    def throughput(self):
+        return self.operations / self.duration if self.duration else 0
+
+    def format(self):
+        """Render the report as human-readable text"""
+        lines = [
+            f"{self.operations} operations in {self.duration:.2f}s "
+            f"({self.throughput:.0f} ops/s)",
+        ]
+        by_kind = defaultdict(list)
+        for kind, status, elapsed in self.results:
+            by_kind[kind].append((status, elapsed))
+        for kind, rows in sorted(by_kind.items()):
+            latencies = sorted(elapsed for _, elapsed in rows)
+            statuses = Counter(status for status, _ in rows)
+            lines.append(
+                f"  {kind:<9} n={len(rows):<6} "
+                f"p50={statistics.median(latencies) * 1000:.1f}ms "
+                f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms "
+                f"statuses={dict(sorted(statuses.items()))}"
+            )
+
+        waiting = [sample for sample in self.lock_samples if sample]
+        lines.append(
+            f"Lock waits: {len(waiting)}/{len(self.lock_samples)} samples, "
+            f"max {max(self.lock_samples, default=0)} waiting sessions, "
+            f"{self.deadlocks} deadlocks"
+        )
+        if self.violations:
+            lines.append("Invariant violations:")
+            lines.extend(f"  - {violation}" for violation in self.violations)
+        else:
+            lines.append("All invariants held.")
+        return "\n".join(lines)
+
+
+class StressHarness:
+    """Run a mixed vote/create/update workload and verify the results
+
+    Pool features start with more votes than the run can remove, so their
+    final totals must match the successful votes exactly. Floor features
+    only receive downvotes and must settle at zero without going negative.
+    Create and update requests draw titles from a small shared set so
+    concurrent requests race on title uniqueness. Detail reads refill the
+    feature cache while votes invalidate it, so a stale refill shows up as
+    a cached vote count that differs from the database.
+    """
+
+    def __init__(
+        self,
+        threads=8,
+        operations=400,
+        features=5,
+        titles=20,
+        mix=None,
+        seed=None,
+        host="testserver",
+    ):
+        self.threads = threads
+        self.operations = operations
+        self.feature_count = features
+        self.titles = titles
+        self.mix = mix or DEFAULT_MIX
+        self.seed = seed
+        self.host = host
+        self.tally = Counter()
+        self.vote_times = defaultdict(list)
+        self.reads = defaultdict(list)
+        self.tally_lock = threading.Lock()
+
+    def setup(self):
+        """Create an isolated board with pool and floor features"""
+        suffix = get_random_string(8).lower()
+        self.board = Board.objects.create(
+            name=f"Stress {suffix}", slug=f"stress-{suffix}"
+        )
+        self.initial_votes = self.operations
+        self.pool = [
+            Feature.objects.create(
+                board=self.board,
+                title=f"Stress pool feature {i}",
+                description="Stress pool feature",
+                votes=self.initial_votes,
+            )
+            for i in range(self.feature_count)
+        ]
+        self.floor = [
+            Feature.objects.create(
+                board=self.board,
+                title=f"Stress floor feature {i}",
+                description="Stress floor feature",
+                votes=1,
+            )
+            for i in range(self.feature_count)
+        ]
+        self.base_url = f"/v1/boards/{self.board.slug}/features/"
+
+    def teardown(self):
+        """Delete the board and everything created on it"""
+        for feature in Feature.objects.filter(board=self.board):
+            feature.delete()
+        self.board.delete()
+
+    def run(self):
+        """Run the workload and return a StressReport"""
+        self.setup()
+        try:
+            return self.execute()
+        finally:
+            self.teardown()
+
+    def execute(self):
+        rng = random.Random(self.seed)
+        kinds = list(self.mix)
+        weights = [self.mix[kind] for kind in kinds]
+        plan = [
+            (rng.choices(kinds, weights)[0], rng.random())
+            for _ in range(self.operations)
+        ]
+        chunks = [plan[i :: self.threads] for i in range(self.threads)]
+
+        stop = threading.Event()
+        lock_samples = []
+        deadlocks_before = self.count_deadlocks()
+        monitor = threading.Thread(
+            target=self.sample_lock_waits, args=(stop, lock_samples)
+        )
+        monitor.start()
+
+        # Disable vote throttling; this exercises the database, not the limits
+        rates = {**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": {}}
+        # Title races are expected to fail; don't log every 400
+        request_logger = logging.getLogger("django.request")
+        level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        started = time.perf_counter()
+        try:
+            with override_settings(REST_FRAMEWORK=rates):
+                with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                    results = [
+                        row
+                        for rows in executor.map(self.worker, chunks)
+                        for row in rows
+                    ]
+        finally:
+            duration = time.perf_counter() - started
+            request_logger.setLevel(level)
+
+        stop.set()
+        monitor.join()
+        deadlocks = self.count_deadlocks() - deadlocks_before
+        violations = self.check_invariants(results)
+        return StressReport(duration, results, lock_samples, deadlocks, violations)
+
+    def worker(self, chunk):
+        """Execute one thread's share of the plan"""
+        client = Client(SERVER_NAME=self.host)
+        results = []
+        try:
+            for kind, roll in chunk:
+                started = time.perf_counter()
+                feature_id, response = self.perform(client, kind, roll)
+                finished = time.perf_counter()
+                results.append((kind, response.status_code, finished - started))
+                self.record(kind, feature_id, response, started, finished)
+        finally:
+            connection.close()
+        return results
+
+    def perform(self, client, kind, roll):
+        """Issue a single request; return (feature_id, response)"""
+        title = f"Stress title {int(roll * self.titles)}"
+        if kind == "create":
+            response = client.post(
+                self.base_url,
+                {"title": title, "description": "Created under stress"},
+                content_type="application/json",
+            )
+            return None, response
+        if kind == "list":
+            return None, client.get(self.base_url)
+
+        if kind in ["downvote", "retrieve"] and roll < 0.5:
+            feature = self.floor[int(roll * 2 * len(self.floor))]
+        else:
+            feature = self.pool[int(roll * len(self.pool))]
+        url = f"{self.base_url}{feature.id}/"
+        if kind == "update":
+            response = client.patch(
+                url, {"title": title}, content_type="application/json"
+            )
+        elif kind == "retrieve":
+            response = client.get(url)
+        else:
+            response = client.post(f"{url}{kind}/")
+        return feature.id, response
+
+    def record(self, kind, feature_id, response, started, finished):
+        """Tally successful votes and reads per feature for the invariant checks"""
+        if feature_id is None or response.status_code != 200:
+            return
+        with self.tally_lock:
+            if kind in ["upvote", "downvote"]:
+                self.tally[(feature_id, kind)] += 1
+                self.vote_times[(feature_id, kind)].append((started, finished))
+            elif kind == "retrieve":
+                votes = response.json()["votes"]
+                self.reads[feature_id].append((started, finished, votes))
+
+    def check_invariants(self, results):
+        """Return a list of human-readable invariant violations"""
+        violations = []
+        errors = Counter(kind for kind, status, _ in results if status >= 500)
+        if errors:
+            violations.append(f"server errors: {dict(errors)}")
+
+        for feature in self.pool:
+            feature.refresh_from_db()
+            expected = (
+                self.initial_votes
+                + self.tally[(feature.id, "upvote")]
+                - self.tally[(feature.id, "downvote")]
+            )
+            if feature.votes != expected:
+                violations.append(
+                    f"feature {feature.id} has {feature.votes} votes, expected {expected}"
+                )
+        violations.extend(self.check_reads())
+        for feature in self.floor:
+            feature.refresh_from_db()
+            if feature.votes < 0:
+                violations.append(f"feature {feature.id} has {feature.votes} votes")
+            expected = max(0, 1 - self.tally[(feature.id, "downvote")])
+            if feature.votes != expected:
+                violations.append(
+                    f"floor feature {feature.id} has {feature.votes} votes, "
+                    f"expected {expected}"
+                )
+
+        duplicates = (
+            Feature.objects.filter(board=self.board)
+            .values(lowered=Lower("title"))
+            .annotate(total=Count("id"))
+            .filter(total__gt=1)
+        )
+        for row in duplicates:
+            violations.append(f"duplicate title {row['lowered']!r} x{row['total']}")
+
+        self.board.refresh_from_db()
+        actual = Feature.objects.filter(board=self.board).count()
+        if self.board.feature_count != actual:
+            violations.append(
+                f"board feature_count is {self.board.feature_count}, "
+                f"but it has {actual} features"
+            )
+
+        for feature in [*self.pool, *self.floor]:
+            cached = get_cached_feature(feature.id)
+            if cached is not None and cached["votes"] != feature.votes:
+                violations.append(
+                    f"cache has {cached['votes']} votes for feature {feature.id}, "
+                    f"database has {feature.votes}"
+                )
+        return violations
+
+    def check_reads(self):
+        """Check each detail read of a pool feature saw a possible vote count
+
+        A read may include any of the votes that overlapped it, but must
+        include every vote that finished before it started, and none that
+        started after it finished.
+        """
+        violations = []
+        for feature in self.pool:
+            starts, ends = {}, {}
+            for kind in ["upvote", "downvote"]:
+                times = self.vote_times[(feature.id, kind)]
+                starts[kind] = sorted(started for started, _ in times)
+                ends[kind] = sorted(finished for _, finished in times)
+
+            stale = []
+            for started, finished, votes in self.reads[feature.id]:
+                low = (
+                    self.initial_votes
+                    + bisect(ends["upvote"], started)
+                    - bisect(starts["downvote"], finished)
+                )
+                high = (
+                    self.initial_votes
+                    + bisect(starts["upvote"], finished)
+                    - bisect(ends["downvote"], started)
+                )
+                if not low <= votes <= high:
+                    stale.append(f"{votes} not in {low}..{high}")
+            if stale:
+                violations.append(
+                    f"{len(stale)} of {len(self.reads[feature.id])} reads of "
+                    f"feature {feature.id} saw an impossible vote count, "
+                    f"e.g. {stale[0]}"
+                )
+        return violations
+
+    def sample_lock_waits(self, stop, samples):
+        """Record how many sessions are waiting on a lock, every 10ms"""
+        try:
+            with connection.cursor() as cursor:
+                while not stop.is_set():
+                    cursor.execute(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE datname = current_database() "
+                        "AND wait_event_type = 'Lock'"
+                    )
+                    samples.append(cursor.fetchone()[0])
+                    stop.wait(0.01)
+        finally:
+            connection.close()
+
+    def count_deadlocks(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT deadlocks FROM pg_stat_database "
+                "WHERE datname = current_database()"
+            )
+            return cursor.fetchone()[0]
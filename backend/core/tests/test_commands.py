@@ -0,0 +1,71 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from core.models import ArchivedFeature, Feature, FeatureTombstone
+
+
+class ArchiveFeaturesCommandTest(TestCase):
+    def setUp(self):
+        """Set up a mix of stale and active features"""
+        cache.clear()
+        self.stale = Feature.objects.create(
+            title="Stale Feature", description="Nobody cares"
+        )
+        self.popular = Feature.objects.create(
+            title="Old Popular Feature", description="Still loved", votes=10
+        )
+        self.fresh = Feature.objects.create(
+            title="Fresh Feature", description="Brand new"
+        )
+        old = timezone.now() - timedelta(days=400)
+        Feature.objects.filter(pk__in=[self.stale.pk, self.popular.pk]).update(
+            updated_at=old
+        )
+
+    def archive(self, *args):
+        out = StringIO()
+        call_command("archive_features", *args, stdout=out)
+        return out.getvalue()
+
+    def test_archives_stale_low_vote_features(self):
+        """Test only stale features under the vote threshold are moved"""
+        output = self.archive()
+
+        self.assertIn("Archived 1 features", output)
+        self.assertFalse(Feature.objects.filter(pk=self.stale.pk).exists())
+        self.assertTrue(Feature.objects.filter(pk=self.popular.pk).exists())
+        self.assertTrue(Feature.objects.filter(pk=self.fresh.pk).exists())
+
+        archived = ArchivedFeature.objects.get(pk=self.stale.pk)
+        self.assertEqual(archived.title, "Stale Feature")
+        self.assertEqual(archived.summary, "Nobody cares")
+        self.assertEqual(archived.created_at, self.stale.created_at)
+        self.assertIsNotNone(archived.archived_at)
+
+    def test_archive_records_tombstones(self):
+        """Test archived features are reported as deleted to the changes feed"""
+        self.archive()
+
+        self.assertTrue(
+            FeatureTombstone.objects.filter(feature_id=self.stale.pk).exists()
+        )
+
+    def test_vote_threshold_and_batches(self):
+        """Test --max-votes widens the selection across several batches"""
+        output = self.archive("--max-votes", "10", "--batch-size", "1")
+
+        self.assertIn("Archived 2 features", output)
+        self.assertEqual(ArchivedFeature.objects.count(), 2)
+        self.assertEqual(list(Feature.objects.all()), [self.fresh])
+
+    def test_dry_run(self):
+        """Test --dry-run reports without moving anything"""
+        output = self.archive("--dry-run")
+
+        self.assertIn("1 features would be archived", output)
+        self.assertEqual(Feature.objects.count(), 3)
+        self.assertEqual(ArchivedFeature.objects.count(), 0)
@@ -1,12 +1,21 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-from django.test import TransactionTestCase
-from core.models import Feature
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TransactionTestCase
+from core.cache import get_cached_feature
+from core.models import Board, Feature
+from core.stress import StressHarness
+from core.throttling import local_store
+from core.warmup import prime_feature_cache, warm_up
 
 
 class FeatureIntegrationTest(TransactionTestCase):
     def setUp(self):
         """Set up test data"""
+        cache.clear()
+        local_store.clear()
         self.feature = Feature.objects.create(
             title="Integration Test Feature",
             description="Testing integration scenarios",
@@ -30,6 +39,84 @@ class FeatureIntegrationTest(TransactionTestCase):
         self.feature.refresh_from_db()
         self.assertEqual(self.feature.votes, 5)
 
+    def test_threaded_voting_keeps_cache_consistent(self):
+        """Test threaded votes leave the cached detail equal to the DB"""
+        url = f"/v1/features/{self.feature.id}/"
+        self.client.get(url)
+
+        def vote(action):
+            try:
+                return Client().post(f"{url}{action}/").status_code
+            finally:
+                connection.close()
+
+        actions = ["upvote"] * 40
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(vote, actions))
+
+        self.assertEqual(statuses, [200] * len(actions))
+        self.feature.refresh_from_db()
+        self.assertEqual(self.feature.votes, 40)
+        self.assertEqual(self.client.get(url).json()["votes"], 40)
+
+    def test_threaded_reads_and_votes_keep_cache_consistent(self):
+        """Test detail reads racing votes never leave a stale cached detail"""
+        url = f"/v1/features/{self.feature.id}/"
+
+        def request(action):
+            try:
+                if action == "read":
+                    return Client().get(url).status_code
+                return Client().post(f"{url}{action}/").status_code
+            finally:
+                connection.close()
+
+        actions = ["read", "upvote"] * 40
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(request, actions))
+
+        self.assertEqual(statuses, [200] * len(actions))
+        self.feature.refresh_from_db()
+        self.assertEqual(self.feature.votes, 40)
+        self.assertEqual(self.client.get(url).json()["votes"], 40)
+
+    def test_stress_harness_invariants(self):
+        """Test mixed concurrent votes, creates and updates keep invariants"""
+        report = StressHarness(threads=8, operations=300, seed=35).run()
+
+        self.assertEqual(report.violations, [])
+        self.assertEqual(report.operations, 300)
+        self.assertFalse(Board.objects.filter(slug__startswith="stress-").exists())
+
+    def test_prime_feature_cache(self):
+        """Test prime_feature_cache caches the top voted features"""
+        popular = Feature.objects.create(
+            title="Popular Feature", description="Loved", votes=10
+        )
+
+        with self.settings(WARMUP_FEATURES=1):
+            prime_feature_cache()
+
+        self.assertEqual(get_cached_feature(popular.id)["votes"], 10)
+        self.assertIsNone(get_cached_feature(self.feature.id))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(f"/v1/features/{popular.id}/")
+        self.assertEqual(response.json()["title"], "Popular Feature")
+
+    def test_prime_feature_cache_skips_disabled_cache(self):
+        """Test prime_feature_cache does nothing when the feature cache is off"""
+        with self.settings(FEATURE_CACHE_ENABLED=False):
+            prime_feature_cache()
+
+        self.assertIsNone(get_cached_feature(self.feature.id))
+
+    def test_warm_up_leaves_feature_cache_empty(self):
+        """Test warm_up in the master doesn't fill a cache workers inherit"""
+        warm_up()
+
+        self.assertIsNone(get_cached_feature(self.feature.id))
+
     def test_feature_lifecycle(self):
         """Test complete feature lifecycle: create, read, update, vote, delete"""
         # Create
@@ -1,6 +1,7 @@
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 from django.test import TestCase
-from core.models import Feature
+from core.models import Board, Feature, FeatureTombstone
 
 
 class FeatureModelTest(TestCase):
@@ -21,6 +22,18 @@ class FeatureModelTest(TestCase):
         self.assertIsNotNone(feature.created_at)
         self.assertIsNotNone(feature.updated_at)
 
+    def test_summary_truncates_description(self):
+        """Test summary is a truncated copy of the description"""
+        feature = Feature.objects.create(title="Long Feature", description="x" * 500)
+
+        self.assertEqual(len(feature.summary), 200)
+        self.assertTrue(feature.summary.endswith("…"))
+
+        feature.description = "Short"
+        feature.save(update_fields=["description"])
+        feature.refresh_from_db()
+        self.assertEqual(feature.summary, "Short")
+
     def test_feature_str_representation(self):
         """Test string representation of feature"""
         feature = Feature.objects.create(**self.feature_data)
@@ -77,6 +90,30 @@ class FeatureModelTest(TestCase):
 
         self.assertEqual(feature.votes, 0)
 
+    def test_vote_bumps_updated_at(self):
+        """Test voting advances updated_at so the change is detectable"""
+        feature = Feature.objects.create(**self.feature_data)
+        previous = feature.updated_at
+
+        feature.upvote()
+        feature.refresh_from_db()
+        self.assertGreater(feature.updated_at, previous)
+
+        previous = feature.updated_at
+        feature.downvote()
+        feature.refresh_from_db()
+        self.assertGreater(feature.updated_at, previous)
+
+    def test_delete_leaves_tombstone(self):
+        """Test deleting a feature records a tombstone"""
+        feature = Feature.objects.create(**self.feature_data)
+        feature_id = feature.id
+
+        feature.delete()
+
+        self.assertFalse(Feature.objects.filter(id=feature_id).exists())
+        self.assertTrue(FeatureTombstone.objects.filter(feature_id=feature_id).exists())
+
     def test_title_min_length_validation(self):
         """Test title minimum length validation"""
         with self.assertRaises(ValidationError):
@@ -95,3 +132,42 @@ class FeatureModelTest(TestCase):
         with self.assertRaises(ValidationError):
             feature = Feature(title="Valid Title", description="")
             feature.full_clean()
+
+
+class BoardModelTest(TestCase):
+    def setUp(self):
+        """Set up test boards"""
+        self.board = Board.objects.create(name="Mobile", slug="mobile")
+        self.other = Board.objects.create(name="Web", slug="web")
+
+    def test_feature_defaults_to_default_board(self):
+        """Test features created without a board land on the default board"""
+        feature = Feature.objects.create(title="Unscoped", description="Desc")
+
+        self.assertEqual(feature.board.slug, "default")
+
+    def test_feature_count_maintained(self):
+        """Test feature_count tracks creates and deletes"""
+        first = Feature.objects.create(
+            board=self.board, title="Feature 1", description="Desc"
+        )
+        Feature.objects.create(board=self.board, title="Feature 2", description="Desc")
+        first.votes = 3
+        first.save()
+
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.feature_count, 2)
+
+        first.delete()
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.feature_count, 1)
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.feature_count, 0)
+
+    def test_title_unique_per_board(self):
+        """Test titles are unique per board, case-insensitively"""
+        Feature.objects.create(board=self.board, title="Dark Mode", description="A")
+        Feature.objects.create(board=self.other, title="Dark Mode", description="B")
+
+        with self.assertRaises(IntegrityError):
+            Feature.objects.create(board=self.board, title="dark mode", description="C")
@@ -1,12 +1,27 @@
 import json
-
-from django.test import Client, TestCase
-from core.models import Feature
-
-
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from core.models import Board, Feature
+from core.serializers import FeatureSerializer
+from core.throttling import LocalTokenBucketStore, local_store
+from core.views import FeatureViewSet
+
+
+@override_settings(FEATURE_SYNC_LAG=0)
 class FeatureAPITest(TestCase):
     def setUp(self):
         """Set up test client and data"""
+        cache.clear()
+        local_store.clear()
         self.client = Client()
         self.feature_data = {
             "title": "Test Feature",
@@ -21,6 +36,13 @@ class FeatureAPITest(TestCase):
             title="Feature 2", description="Description 2", votes=3
         )
 
+    def archive_feature(self, feature):
+        """Move a feature into the archive tier"""
+        Feature.objects.filter(pk=feature.pk).update(
+            updated_at=timezone.now() - timedelta(days=400), votes=0
+        )
+        call_command("archive_features", stdout=StringIO())
+
     def test_get_feature_list(self):
         """Test GET /v1/features/ returns feature list"""
         response = self.client.get("/v1/features/")
@@ -47,6 +69,93 @@ class FeatureAPITest(TestCase):
         self.assertEqual(data["count"], 1)
         self.assertEqual(data["results"][0]["title"], "Feature 1")
 
+    def test_get_feature_list_sparse_fields(self):
+        """Test GET /v1/features/ with fields only returns those fields"""
+        response = self.client.get("/v1/features/?fields=id,title,summary,votes")
+
+        self.assertEqual(response.status_code, 200)
+        result = response.json()["results"][0]
+        self.assertEqual(set(result), {"id", "title", "summary", "votes"})
+        self.assertEqual(result["summary"], "Description 1")
+
+    def test_get_feature_list_sparse_fields_defers_columns(self):
+        """Test sparse fieldsets don't read unused columns"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/v1/features/?fields=id,title")
+
+        select = [q["sql"] for q in queries if '"core_feature"."title"' in q["sql"]]
+        self.assertEqual(len(select), 1)
+        self.assertNotIn('"core_feature"."description"', select[0])
+
+    def test_get_feature_list_unknown_field(self):
+        """Test GET /v1/features/ with an unknown field returns 400"""
+        response = self.client.get("/v1/features/?fields=id,secret")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json())
+
+    def test_get_feature_list_empty_fields(self):
+        """Test GET /v1/features/ with only blank field names returns 400"""
+        for url in [
+            "/v1/features/?fields=,",
+            f"/v1/features/{self.feature1.id}/?fields= ",
+        ]:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("fields", response.json())
+
+    def test_top_voted_sparse_fields(self):
+        """Test GET /v1/features/top_voted/ honours fields"""
+        response = self.client.get("/v1/features/top_voted/?fields=id,votes")
+
+        self.assertEqual(response.json()[0], {"id": self.feature1.id, "votes": 5})
+
+    def test_get_feature_detail_sparse_fields(self):
+        """Test GET /v1/features/{id}/ honours fields"""
+        response = self.client.get(f"/v1/features/{self.feature1.id}/?fields=title")
+
+        self.assertEqual(response.json(), {"title": "Feature 1"})
+
+    def test_get_feature_list_excludes_archived(self):
+        """Test GET /v1/features/ only lists the live tier by default"""
+        self.archive_feature(self.feature2)
+
+        response = self.client.get("/v1/features/?search=Feature")
+
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_get_feature_list_include_archived(self):
+        """Test GET /v1/features/?include_archived=1 searches both tiers"""
+        self.archive_feature(self.feature2)
+        Feature.objects.create(title="Feature 3", description="Top", votes=9)
+
+        response = self.client.get(
+            "/v1/features/?include_archived=1&search=Feature&fields=id,title"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(
+            [f["title"] for f in data["results"]],
+            ["Feature 3", "Feature 1", "Feature 2"],
+        )
+        self.assertEqual(set(data["results"][0]), {"id", "title"})
+
+    def test_get_archived_feature_detail(self):
+        """Test archived features are only retrievable with include_archived"""
+        self.archive_feature(self.feature2)
+        url = f"/v1/features/{self.feature2.id}/"
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        response = self.client.get(f"{url}?include_archived=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "Feature 2")
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
     def test_get_feature_detail(self):
         """Test GET /v1/features/{id}/ returns specific feature"""
         response = self.client.get(f"/v1/features/{self.feature1.id}/")
@@ -63,6 +172,93 @@ class FeatureAPITest(TestCase):
         response = self.client.get("/v1/features/999/")
         self.assertEqual(response.status_code, 404)
 
+    def test_get_feature_detail_cached(self):
+        """Test repeated GET /v1/features/{id}/ is served from the cache"""
+        url = f"/v1/features/{self.feature1.id}/"
+        first = self.client.get(url).json()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.json(), first)
+
+    @override_settings(FEATURE_CACHE_ENABLED=False)
+    def test_get_feature_detail_cache_disabled(self):
+        """Test GET /v1/features/{id}/ reads the DB when the cache is off"""
+        url = f"/v1/features/{self.feature1.id}/"
+        self.client.get(url)
+        Feature.objects.filter(pk=self.feature1.id).update(votes=9)
+
+        self.assertEqual(self.client.get(url).json()["votes"], 9)
+
+    def test_update_invalidates_cached_detail(self):
+        """Test PATCH /v1/features/{id}/ refreshes the cached detail"""
+        url = f"/v1/features/{self.feature1.id}/"
+        self.client.get(url)
+
+        self.client.patch(
+            url,
+            data=json.dumps({"title": "Renamed Feature"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(self.client.get(url).json()["title"], "Renamed Feature")
+
+    def test_delete_invalidates_cached_detail(self):
+        """Test DELETE /v1/features/{id}/ drops the cached detail"""
+        url = f"/v1/features/{self.feature1.id}/"
+        self.client.get(url)
+
+        self.client.delete(url)
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_vote_on_cached_feature(self):
+        """Test voting on a cached feature updates both DB and detail"""
+        url = f"/v1/features/{self.feature1.id}/"
+        self.client.get(url)
+
+        response = self.client.post(f"{url}upvote/")
+
+        self.assertEqual(response.json()["votes"], 6)
+        self.assertEqual(self.client.get(url).json()["votes"], 6)
+
+    def test_vote_on_zero_padded_cached_feature(self):
+        """Test a detail cached under a zero-padded id is invalidated by votes"""
+        url = f"/v1/features/00{self.feature1.id}/"
+        self.client.get(url)
+
+        self.client.post(f"/v1/features/{self.feature1.id}/upvote/")
+
+        self.assertEqual(self.client.get(url).json()["votes"], 6)
+
+    def test_vote_during_detail_read_is_not_cached_stale(self):
+        """Test a vote landing between a detail read and its cache fill"""
+        url = f"/v1/features/{self.feature1.id}/"
+        get_object = FeatureViewSet.get_object
+
+        def get_object_then_vote(view):
+            instance = get_object(view)
+            Feature.objects.get(pk=instance.pk).upvote()
+            return instance
+
+        with patch.object(FeatureViewSet, "get_object", get_object_then_vote):
+            self.assertEqual(self.client.get(url).json()["votes"], 5)
+
+        self.assertEqual(self.client.get(url).json()["votes"], 6)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).json()["votes"], 6)
+
+    def test_vote_on_cached_deleted_feature(self):
+        """Test voting on a stale cached feature returns 404"""
+        url = f"/v1/features/{self.feature1.id}/"
+        self.client.get(url)
+        Feature.objects.filter(pk=self.feature1.id).delete()
+
+        response = self.client.post(f"{url}upvote/")
+
+        self.assertEqual(response.status_code, 404)
+
     def test_create_feature_success(self):
         """Test POST /v1/features/ creates new feature"""
         response = self.client.post(
@@ -153,6 +349,29 @@ class FeatureAPITest(TestCase):
         self.feature1.refresh_from_db()
         self.assertEqual(self.feature1.title, "Updated Feature Title")
 
+    def test_update_feature_keeps_concurrent_votes(self):
+        """Test PATCH does not overwrite votes applied after the row was read"""
+        get_object = FeatureViewSet.get_object
+
+        def get_object_then_vote(view):
+            instance = get_object(view)
+            Feature.objects.get(pk=instance.pk).upvote()
+            return instance
+
+        with patch.object(FeatureViewSet, "get_object", get_object_then_vote):
+            response = self.client.patch(
+                f"/v1/features/{self.feature1.id}/",
+                data=json.dumps({"title": "Updated Feature Title"}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        votes = self.feature1.votes
+        self.feature1.refresh_from_db()
+        self.assertEqual(self.feature1.title, "Updated Feature Title")
+        self.assertEqual(self.feature1.votes, votes + 1)
+        self.assertEqual(response.json()["votes"], votes + 1)
+
     def test_update_feature_full_update(self):
         """Test PUT /v1/features/{id}/ full update"""
         update_data = {
@@ -262,6 +481,293 @@ class FeatureAPITest(TestCase):
         self.assertIsInstance(data, list)
         self.assertEqual(len(data), 2)
 
+    def test_list_sets_validators(self):
+        """Test GET /v1/features/ returns ETag and Last-Modified headers"""
+        response = self.client.get("/v1/features/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_list_not_modified(self):
+        """Test GET /v1/features/ with a current ETag returns 304"""
+        etag = self.client.get("/v1/features/")["ETag"]
+
+        with patch.object(FeatureSerializer, "to_representation") as serialize:
+            response = self.client.get("/v1/features/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        serialize.assert_not_called()
+
+    def test_list_not_modified_since(self):
+        """Test GET /v1/features/ with a current If-Modified-Since returns 304"""
+        last_modified = self.client.get("/v1/features/")["Last-Modified"]
+
+        response = self.client.get(
+            "/v1/features/", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_not_modified_since(self):
+        """Test GET /v1/features/{id}/ with a current If-Modified-Since returns 304"""
+        url = f"/v1/features/{self.feature1.id}/"
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_has_no_validators_inside_sync_lag(self):
+        """Test a list changed within the sync lag is not cacheable yet"""
+        with self.settings(FEATURE_SYNC_LAG=10):
+            response = self.client.get("/v1/features/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_list_etag_changes_after_vote(self):
+        """Test a vote invalidates the list ETag"""
+        etag = self.client.get("/v1/features/")["ETag"]
+        self.client.post(f"/v1/features/{self.feature2.id}/upvote/")
+
+        response = self.client.get("/v1/features/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_changes_after_delete(self):
+        """Test a delete invalidates the list ETag"""
+        etag = self.client.get("/v1/features/")["ETag"]
+        self.client.delete(f"/v1/features/{self.feature2.id}/")
+
+        response = self.client.get("/v1/features/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_etag_varies_with_query(self):
+        """Test list ETags differ between searches"""
+        etag = self.client.get("/v1/features/")["ETag"]
+
+        response = self.client.get(
+            "/v1/features/?search=Feature 1", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_not_modified(self):
+        """Test GET /v1/features/{id}/ with a current ETag returns 304"""
+        url = f"/v1/features/{self.feature1.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.post(f"/v1/features/{self.feature1.id}/downvote/")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["votes"], 4)
+
+    def test_top_voted_and_recent_not_modified(self):
+        """Test leaderboard endpoints honour If-None-Match"""
+        for url in ["/v1/features/top_voted/", "/v1/features/recent/"]:
+            etag = self.client.get(url)["ETag"]
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+
+    def test_dashboard(self):
+        """Test GET /v1/features/dashboard/ returns all three sections"""
+        newest = Feature.objects.create(title="Feature 3", description="Newest")
+
+        response = self.client.get("/v1/features/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data["features"]["count"], 3)
+        self.assertEqual(
+            [f["id"] for f in data["features"]["results"]],
+            [self.feature1.id, self.feature2.id, newest.id],
+        )
+        self.assertEqual(
+            [f["id"] for f in data["top_voted"]],
+            [self.feature1.id, self.feature2.id, newest.id],
+        )
+        self.assertEqual(
+            [f["id"] for f in data["recent"]],
+            [newest.id, self.feature2.id, self.feature1.id],
+        )
+
+    def test_dashboard_section_limits(self):
+        """Test GET /v1/features/dashboard/ honours per-section limits"""
+        response = self.client.get(
+            "/v1/features/dashboard/?top_limit=1&recent_limit=2&search=Feature 2"
+        )
+        data = response.json()
+
+        self.assertEqual(data["features"]["count"], 1)
+        self.assertEqual([f["votes"] for f in data["top_voted"]], [5])
+        self.assertEqual(len(data["recent"]), 2)
+
+    def test_dashboard_invalid_limit(self):
+        """Test GET /v1/features/dashboard/ rejects bad limits"""
+        for query in ["top_limit=abc", "recent_limit=0", "top_limit=1000"]:
+            response = self.client.get(f"/v1/features/dashboard/?{query}")
+            self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_sparse_fields_single_leaderboard_query(self):
+        """Test the dashboard reads both leaderboards in one query"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/v1/features/dashboard/?fields=id,title")
+
+        self.assertEqual(
+            response.json()["top_voted"][0],
+            {"id": self.feature1.id, "title": "Feature 1"},
+        )
+        unions = [q["sql"] for q in queries if "UNION ALL" in q["sql"]]
+        self.assertEqual(len(unions), 1)
+        self.assertNotIn('"core_feature"."description"', unions[0])
+        # Validators, count, page and the leaderboard union
+        self.assertEqual(len(queries), 5)
+
+    def test_dashboard_not_modified(self):
+        """Test GET /v1/features/dashboard/ honours If-None-Match"""
+        etag = self.client.get("/v1/features/dashboard/")["ETag"]
+
+        response = self.client.get("/v1/features/dashboard/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_changes_without_token_returns_everything(self):
+        """Test GET /v1/features/changes/ without a token returns a full sync"""
+        response = self.client.get("/v1/features/changes/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(len(data["changed"]), 2)
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+        self.assertIsNotNone(data["since"])
+
+    def test_changes_since_token(self):
+        """Test GET /v1/features/changes/ only returns changes after the token"""
+        token = self.client.get("/v1/features/changes/").json()["since"]
+
+        response = self.client.get(f"/v1/features/changes/?since={token}")
+        data = response.json()
+        self.assertEqual(data["changed"], [])
+        self.assertEqual(data["deleted"], [])
+        self.assertEqual(data["since"], token)
+
+        self.client.post(f"/v1/features/{self.feature2.id}/upvote/")
+        self.client.delete(f"/v1/features/{self.feature1.id}/")
+        created = Feature.objects.create(title="Feature 3", description="New")
+
+        response = self.client.get(f"/v1/features/changes/?since={token}")
+        data = response.json()
+
+        changed = {feature["id"]: feature for feature in data["changed"]}
+        self.assertEqual(set(changed), {self.feature2.id, created.id})
+        self.assertEqual(changed[self.feature2.id]["votes"], 4)
+        self.assertEqual(data["deleted"], [self.feature1.id])
+        self.assertNotEqual(data["since"], token)
+
+    def test_changes_pagination(self):
+        """Test GET /v1/features/changes/ pages through large change sets"""
+        with patch.object(FeatureViewSet, "changes_page_size", 1):
+            data = self.client.get("/v1/features/changes/").json()
+            self.assertEqual(len(data["changed"]), 1)
+            self.assertTrue(data["has_more"])
+
+            data = self.client.get(
+                f"/v1/features/changes/?since={data['since']}"
+            ).json()
+            self.assertEqual(len(data["changed"]), 1)
+            self.assertFalse(data["has_more"])
+
+    def test_changes_pagination_with_equal_timestamps(self):
+        """Test paging never skips features changed at the same instant"""
+        Feature.objects.create(title="Feature 3", description="Description 3")
+        Feature.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+
+        seen = []
+        data = {"since": "", "has_more": True}
+        with patch.object(FeatureViewSet, "changes_page_size", 1):
+            while data["has_more"]:
+                data = self.client.get(
+                    f"/v1/features/changes/?since={data['since']}"
+                ).json()
+                seen += [feature["id"] for feature in data["changed"]]
+
+        self.assertEqual(
+            sorted(seen), sorted(Feature.objects.values_list("id", flat=True))
+        )
+
+    def test_changes_pages_deleted_features(self):
+        """Test deleted feature ids are paged like changed features"""
+        token = self.client.get("/v1/features/changes/").json()["since"]
+        deleted = [self.feature1.id, self.feature2.id]
+        self.feature1.delete()
+        self.feature2.delete()
+
+        with patch.object(FeatureViewSet, "changes_page_size", 1):
+            data = self.client.get(f"/v1/features/changes/?since={token}").json()
+            self.assertEqual(data["deleted"], deleted[:1])
+            self.assertTrue(data["has_more"])
+
+            data = self.client.get(
+                f"/v1/features/changes/?since={data['since']}"
+            ).json()
+            self.assertEqual(data["deleted"], deleted[1:])
+            self.assertFalse(data["has_more"])
+
+    def test_changes_token_stays_behind_sync_lag(self):
+        """Test recent changes are resent until they are older than the lag"""
+        Feature.objects.filter(pk=self.feature1.pk).update(
+            updated_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        with self.settings(FEATURE_SYNC_LAG=10):
+            data = self.client.get("/v1/features/changes/").json()
+            self.assertEqual(len(data["changed"]), 2)
+
+            data = self.client.get(
+                f"/v1/features/changes/?since={data['since']}"
+            ).json()
+
+        self.assertEqual([f["id"] for f in data["changed"]], [self.feature2.id])
+
+    def test_changes_accepts_timestamp_token(self):
+        """Test timestamp tokens issued by earlier releases still work"""
+        since = (timezone.now() - timedelta(minutes=1)).isoformat()
+        Feature.objects.filter(pk=self.feature1.pk).update(
+            updated_at=timezone.now() - timedelta(minutes=2)
+        )
+
+        response = self.client.get("/v1/features/changes/", {"since": since})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [f["id"] for f in response.json()["changed"]], [self.feature2.id]
+        )
+
+    def test_changes_invalid_token(self):
+        """Test GET /v1/features/changes/ with a malformed token"""
+        response = self.client.get("/v1/features/changes/?since=yesterday")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.json())
+
+    def test_changes_impossible_date_token(self):
+        """Test GET /v1/features/changes/ with a well-formed but invalid date"""
+        response = self.client.get("/v1/features/changes/?since=2024-02-30T00:00:00")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.json())
+
     def test_invalid_json_request(self):
         """Test POST with invalid JSON"""
         response = self.client.post(
@@ -269,3 +775,247 @@ class FeatureAPITest(TestCase):
         )
 
         self.assertEqual(response.status_code, 400)
+
+
+@override_settings(FEATURE_SYNC_LAG=0)
+class BoardAPITest(TestCase):
+    def setUp(self):
+        """Set up two boards with their own features"""
+        cache.clear()
+        local_store.clear()
+        self.mobile = Board.objects.create(name="Mobile", slug="mobile")
+        self.web = Board.objects.create(name="Web", slug="web")
+        self.mobile_feature = Feature.objects.create(
+            board=self.mobile, title="Offline Mode", description="Mobile", votes=2
+        )
+        self.web_feature = Feature.objects.create(
+            board=self.web, title="Dark Mode", description="Web", votes=7
+        )
+
+    def test_list_boards(self):
+        """Test GET /v1/boards/ lists boards with their feature counts"""
+        response = self.client.get("/v1/boards/")
+
+        self.assertEqual(response.status_code, 200)
+        boards = {board["slug"]: board for board in response.json()["results"]}
+        self.assertEqual(boards["mobile"]["feature_count"], 1)
+
+    def test_delete_board_with_features_conflicts(self):
+        """Test DELETE /v1/boards/{slug}/ refuses while the board has features"""
+        response = self.client.delete("/v1/boards/web/")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertTrue(Feature.objects.filter(pk=self.web_feature.pk).exists())
+
+    def test_delete_empty_board_keeps_tombstones(self):
+        """Test deleting an emptied board keeps its deletions in the feed"""
+        feature_id = self.web_feature.id
+        self.client.delete(f"/v1/boards/web/features/{feature_id}/")
+
+        response = self.client.delete("/v1/boards/web/")
+
+        self.assertEqual(response.status_code, 204)
+        data = self.client.get("/v1/features/changes/").json()
+        self.assertEqual(data["deleted"], [feature_id])
+
+    def test_create_board(self):
+        """Test POST /v1/boards/ creates a board"""
+        response = self.client.post(
+            "/v1/boards/",
+            data=json.dumps({"name": "Desktop", "slug": "desktop"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.client.get("/v1/boards/desktop/").status_code, 200)
+
+    def test_board_feature_list_is_scoped(self):
+        """Test GET /v1/boards/{slug}/features/ only lists that board"""
+        response = self.client.get("/v1/boards/mobile/features/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["id"], self.mobile_feature.id)
+        self.assertEqual(data["results"][0]["board"], self.mobile.id)
+
+    def test_board_feature_list_uses_maintained_count(self):
+        """Test an unsearched board listing doesn't count rows"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/v1/boards/mobile/features/")
+
+        self.assertEqual(response.json()["count"], 1)
+        self.assertFalse(any("COUNT(" in q["sql"] for q in queries))
+
+    def test_board_feature_list_unknown_board(self):
+        """Test GET /v1/boards/{slug}/features/ with an unknown board"""
+        response = self.client.get("/v1/boards/missing/features/")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_create_board_feature(self):
+        """Test POST /v1/boards/{slug}/features/ creates on that board"""
+        response = self.client.post(
+            "/v1/boards/mobile/features/",
+            data=json.dumps({"title": "Dark Mode", "description": "Also here"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["board"], self.mobile.id)
+        self.mobile.refresh_from_db()
+        self.assertEqual(self.mobile.feature_count, 2)
+
+    def test_create_board_feature_duplicate_title(self):
+        """Test titles are unique within a board"""
+        response = self.client.post(
+            "/v1/boards/mobile/features/",
+            data=json.dumps({"title": "offline mode", "description": "Again"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("title", response.json())
+
+    def test_board_feature_detail_other_board(self):
+        """Test features can't be read or voted on through another board"""
+        url = f"/v1/boards/mobile/features/{self.web_feature.id}/"
+        # Cache the feature through its own board first
+        self.client.get(f"/v1/boards/web/features/{self.web_feature.id}/")
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.post(f"{url}upvote/").status_code, 404)
+
+    def test_board_top_voted_is_scoped(self):
+        """Test GET /v1/boards/{slug}/features/top_voted/ only ranks that board"""
+        response = self.client.get("/v1/boards/mobile/features/top_voted/")
+
+        self.assertEqual([f["id"] for f in response.json()], [self.mobile_feature.id])
+
+    def test_board_etag_ignores_other_boards_deletes(self):
+        """Test deleting a feature on one board keeps other boards' ETags"""
+        url = "/v1/boards/mobile/features/"
+        etag = self.client.get(url)["ETag"]
+
+        self.client.delete(f"/v1/boards/web/features/{self.web_feature.id}/")
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_board_changes_are_scoped(self):
+        """Test the changes feed only reports the board's features"""
+        self.client.delete(f"/v1/boards/web/features/{self.web_feature.id}/")
+
+        data = self.client.get("/v1/boards/mobile/features/changes/").json()
+
+        self.assertEqual([f["id"] for f in data["changed"]], [self.mobile_feature.id])
+        self.assertEqual(data["deleted"], [])
+
+
+def throttle_rates(**rates):
+    """Override the vote throttle rates, keeping the rest of REST_FRAMEWORK"""
+    return override_settings(
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": rates}
+    )
+
+
+class VoteThrottleTest(TestCase):
+    def setUp(self):
+        """Set up features and empty token buckets"""
+        cache.clear()
+        local_store.clear()
+        self.feature = Feature.objects.create(title="Feature 1", description="One")
+        self.other = Feature.objects.create(title="Feature 2", description="Two")
+
+    def upvote(self, feature, client_ip="10.0.0.1"):
+        return self.client.post(
+            f"/v1/features/{feature.id}/upvote/", REMOTE_ADDR=client_ip
+        )
+
+    @throttle_rates(vote_client="2/min")
+    def test_client_limit(self):
+        """Test a client is throttled once its bucket is empty"""
+        self.assertEqual(self.upvote(self.feature).status_code, 200)
+        self.assertEqual(self.upvote(self.other).status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.upvote(self.feature)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        self.assertEqual(self.upvote(self.feature, "10.0.0.2").status_code, 200)
+        self.feature.refresh_from_db()
+        self.assertEqual(self.feature.votes, 2)
+
+    @throttle_rates(vote_feature="2/min")
+    def test_feature_limit(self):
+        """Test a feature is throttled across clients"""
+        self.assertEqual(self.upvote(self.feature, "10.0.0.1").status_code, 200)
+        self.assertEqual(self.upvote(self.feature, "10.0.0.2").status_code, 200)
+
+        self.assertEqual(self.upvote(self.feature, "10.0.0.3").status_code, 429)
+        self.assertEqual(self.upvote(self.other, "10.0.0.3").status_code, 200)
+
+    @throttle_rates(vote_client="1/min", vote_feature="2/min")
+    def test_throttled_client_does_not_drain_feature(self):
+        """Test rejected client votes don't consume the feature's budget"""
+        self.upvote(self.feature, "10.0.0.1")
+        for _ in range(5):
+            self.assertEqual(self.upvote(self.feature, "10.0.0.1").status_code, 429)
+
+        self.assertEqual(self.upvote(self.feature, "10.0.0.2").status_code, 200)
+
+    @throttle_rates(vote_client="1/min")
+    def test_spoofed_forwarded_for_shares_client_bucket(self):
+        """Test a forged X-Forwarded-For does not get a fresh client bucket"""
+        self.assertEqual(self.upvote(self.feature).status_code, 200)
+
+        response = self.client.post(
+            f"/v1/features/{self.other.id}/upvote/",
+            REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="203.0.113.7",
+        )
+
+        self.assertEqual(response.status_code, 429)
+
+    @throttle_rates(vote_feature="1/min")
+    def test_zero_padded_id_shares_feature_bucket(self):
+        """Test a zero-padded feature id is throttled with the feature"""
+        self.assertEqual(self.upvote(self.feature, "10.0.0.1").status_code, 200)
+
+        response = self.client.post(
+            f"/v1/features/0{self.feature.id}/upvote/", REMOTE_ADDR="10.0.0.2"
+        )
+
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(VOTE_THROTTLE_STORE="cache")
+    @throttle_rates(vote_client="1/min")
+    def test_cache_store(self):
+        """Test the cache-backed store enforces the same limits"""
+        self.assertEqual(self.upvote(self.feature).status_code, 200)
+        self.assertEqual(self.upvote(self.feature).status_code, 429)
+        self.assertEqual(len(local_store.buckets), 0)
+
+    @throttle_rates(vote_client="1/min", vote_feature="1/min")
+    def test_throttled_votes_are_counted(self):
+        """Test GET /v1/metrics/ reports throttled votes by limit"""
+        self.upvote(self.feature, "10.0.0.1")
+        self.upvote(self.feature, "10.0.0.1")
+        self.upvote(self.feature, "10.0.0.2")
+
+        response = self.client.get("/v1/metrics/")
+
+        self.assertEqual(
+            response.json(), {"votes_throttled": {"client": 1, "feature": 1}}
+        )
+
+    def test_bucket_refills(self):
+        """Test tokens refill at the configured rate"""
+        store = LocalTokenBucketStore()
+        with patch("core.throttling.time.monotonic", side_effect=[0, 0, 0.5, 1]):
+            self.assertEqual(store.consume("key", 1, 1.0), (True, 0))
+            allowed, wait = store.consume("key", 1, 1.0)
+            self.assertFalse(allowed)
+            self.assertEqual(wait, 1.0)
+            self.assertFalse(store.consume("key", 1, 1.0)[0])
+            self.assertTrue(store.consume("key", 1, 1.0)[0])
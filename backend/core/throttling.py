@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from . import metrics
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """Turn a DRF-style rate such as ``"30/min"`` into (capacity, tokens/sec)"""
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+def refill(tokens, updated, capacity, rate, now):
+    """Return the token count after refilling since ``updated``"""
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+class LocalTokenBucketStore:
+    """Thread-safe in-process token buckets, evicting the least recently used"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def consume(self, key, capacity, rate):
+        """Take a token from ``key``; return (allowed, seconds until next token)"""
+        now = time.monotonic()
+        with self.lock:
+            tokens, updated = self.buckets.pop(key, (capacity, now))
+            tokens = refill(tokens, updated, capacity, rate, now)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_entries:
+                self.buckets.popitem(last=False)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def clear(self):
+        with self.lock:
+            self.buckets.clear()
+
+
+class CacheTokenBucketStore:
+    """Token buckets kept in the cache backend so workers share one budget
+
+    The read-modify-write is not atomic, so racing workers can occasionally
+    let an extra request through; the limits are approximate by design.
+    """
+
+    def consume(self, key, capacity, rate):
+        now = time.time()
+        tokens, updated = cache.get(key, (capacity, now))
+        tokens = refill(tokens, updated, capacity, rate, now)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        # Once a bucket has refilled completely it no longer needs storing
+        cache.set(key, (tokens, now), timeout=int(capacity / rate) + 1)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+    def clear(self):
+        pass
+
+
+local_store = LocalTokenBucketStore()
+cache_store = CacheTokenBucketStore()
+
+
+def get_store():
+    """Return the bucket store selected by ``VOTE_THROTTLE_STORE``"""
+    if settings.VOTE_THROTTLE_STORE == "cache":
+        return cache_store
+    return local_store
+
+
+class VoteRateThrottle(BaseThrottle):
+    """Limit votes per client and per feature with token buckets
+
+    The feature bucket is only charged once the client bucket allows the
+    vote, so a single abusive client can't lock everyone else out of a
+    feature. Rates come from the ``vote_client`` and ``vote_feature``
+    entries of ``DEFAULT_THROTTLE_RATES``; a missing rate disables that
+    limit. Rejections never touch the database.
+    """
+
+    def allow_request(self, request, view):
+        self.wait_seconds = 0
+        checks = [
+            ("vote_client", self.get_ident(request)),
+            ("vote_feature", int(view.kwargs["pk"])),
+        ]
+        for scope, ident in checks:
+            rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+            if not rate:
+                continue
+
+            capacity, refill_rate = parse_rate(rate)
+            allowed, self.wait_seconds = get_store().consume(
+                f"throttle:{scope}:{ident}", capacity, refill_rate
+            )
+            if not allowed:
+                metrics.increment(f"votes_throttled.{scope}")
+                return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
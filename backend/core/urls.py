@@ -1,7 +1,16 @@
-from rest_framework.routers import DefaultRouter
-from .views import FeatureViewSet
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter, SimpleRouter
+from .views import BoardViewSet, FeatureViewSet, MetricsView
 
 router = DefaultRouter()
+router.register(r"boards", BoardViewSet, basename="board")
 router.register(r"features", FeatureViewSet, basename="feature")
 
-urlpatterns = router.urls
+# Board-scoped feature routes: /v1/boards/{slug}/features/
+board_router = SimpleRouter()
+board_router.register(r"features", FeatureViewSet, basename="board-feature")
+
+urlpatterns = router.urls + [
+    path("boards/<slug:board_slug>/", include(board_router.urls)),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+]
@@ -1,18 +1,74 @@
-from django.db.models import Q
+import hashlib
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Count, Max, ProtectedError, Q, Value
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from .models import Feature
+from . import metrics
+from .cache import cache_feature, get_cached_feature, get_feature_generation
+from .models import ArchivedFeature, Board, Feature, FeatureTombstone
 from .serializers import (
+    BoardSerializer,
     FeatureCreateSerializer,
     FeatureSerializer,
     FeatureUpdateSerializer,
 )
+from .throttling import VoteRateThrottle
+
+# Sync token times are microseconds since this instant
+SYNC_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class MetricsView(APIView):
+    def get(self, request):
+        """Get operational counters, such as throttled votes"""
+        counters = metrics.get_counters(
+            ["votes_throttled.vote_client", "votes_throttled.vote_feature"]
+        )
+        return Response(
+            {
+                "votes_throttled": {
+                    "client": counters["votes_throttled.vote_client"],
+                    "feature": counters["votes_throttled.vote_feature"],
+                }
+            }
+        )
+
+
+class BoardViewSet(viewsets.ModelViewSet):
+    queryset = Board.objects.all()
+    serializer_class = BoardSerializer
+    lookup_field = "slug"
+
+    def destroy(self, request, *args, **kwargs):
+        """Delete a board, refusing while it still has live or archived features"""
+        try:
+            return super().destroy(request, *args, **kwargs)
+        except ProtectedError:
+            return Response(
+                {"detail": "Delete or move the board's features first."},
+                status=status.HTTP_409_CONFLICT,
+            )
 
 
 class FeatureViewSet(viewsets.ModelViewSet):
     queryset = Feature.objects.all()
+    lookup_value_regex = r"\d+"
+    changes_page_size = 500
+    dashboard_max_limit = 50
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -22,9 +78,64 @@ class FeatureViewSet(viewsets.ModelViewSet):
             return FeatureUpdateSerializer
         return FeatureSerializer
 
-    def get_queryset(self):
-        """Filter features based on query parameters"""
-        queryset = Feature.objects.all()
+    def get_board(self):
+        """Return the board from a nested route, or None on the global routes"""
+        if "board_slug" not in self.kwargs:
+            return None
+        if not hasattr(self, "_board"):
+            self._board = get_object_or_404(Board, slug=self.kwargs["board_slug"])
+        return self._board
+
+    def scope_to_board(self, queryset):
+        """Restrict a feature or tombstone queryset to the current board"""
+        board = self.get_board()
+        if board is None:
+            return queryset
+        return queryset.filter(board=board)
+
+    def get_serializer_context(self):
+        """Pass the board new features are validated against and saved to"""
+        context = super().get_serializer_context()
+        if self.action == "create":
+            context["board"] = self.get_board() or Board.get_default()
+        return context
+
+    def get_serializer(self, *args, **kwargs):
+        """Serialize only the requested sparse fieldset, if any"""
+        if self.get_serializer_class() is FeatureSerializer:
+            kwargs.setdefault("fields", self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_requested_fields(self):
+        """Parse the ``fields`` query parameter into a list of field names"""
+        param = self.request.query_params.get("fields")
+        if not param:
+            return None
+
+        fields = [name.strip() for name in param.split(",") if name.strip()]
+        if not fields:
+            raise ValidationError({"fields": "At least one field is required."})
+        unknown = set(fields) - set(FeatureSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}."}
+            )
+        return fields
+
+    def apply_sparse_fieldset(self, queryset, *required):
+        """Only load the columns needed for the requested fields"""
+        fields = self.get_requested_fields()
+        if fields is None:
+            return queryset
+        return queryset.only(*fields, *required)
+
+    def include_archived(self):
+        """Whether the request opted into searching the archive tier too"""
+        value = self.request.query_params.get("include_archived", "")
+        return value.lower() in ["1", "true", "yes"]
+
+    def filter_features(self, queryset):
+        """Apply the search query parameter to a feature queryset"""
         search = self.request.query_params.get("search", None)
 
         if search:
@@ -34,11 +145,177 @@ class FeatureViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_tiers(self):
+        """Return the filtered querysets for each storage tier to search
+
+        Only the live tier is searched unless a list request sets
+        ``include_archived``.
+        """
+        tiers = [self.filter_features(self.scope_to_board(Feature.objects.all()))]
+        if self.action in ["list", "dashboard"] and self.include_archived():
+            archived = self.scope_to_board(ArchivedFeature.objects.defer("archived_at"))
+            tiers.append(self.filter_features(archived))
+        return tiers
+
+    def get_queryset(self):
+        """Filter features based on query parameters"""
+        live, *archived = self.get_tiers()
+        if self.action not in ["list", "dashboard"]:
+            return live
+        if not archived:
+            return self.apply_sparse_fieldset(live)
+
+        # Merge the tiers; the ordering columns must be selected on both sides
+        live = self.apply_sparse_fieldset(live, "votes", "created_at")
+        archived = self.apply_sparse_fieldset(archived[0], "votes", "created_at")
+        return (
+            live.order_by()
+            .union(archived.order_by(), all=True)
+            .order_by("-votes", "-created_at")
+        )
+
+    def get_version(self, *querysets):
+        """Return the combined row count and newest change time of ``querysets``
+
+        An unsearched board listing takes its count from the board's
+        incrementally maintained ``feature_count`` instead of counting rows.
+        """
+        count = 0
+        stamps = []
+        board = self.get_board()
+        for queryset in querysets:
+            queryset = queryset.order_by()
+            if (
+                board is not None
+                and queryset.model is Feature
+                and not self.request.query_params.get("search")
+            ):
+                count += board.feature_count
+                stamps.append(queryset.aggregate(last=Max("updated_at"))["last"])
+                continue
+
+            state = queryset.aggregate(
+                count=Count("id"), last_modified=Max("updated_at")
+            )
+            count += state["count"]
+            stamps.append(state["last_modified"])
+        tombstones = self.scope_to_board(FeatureTombstone.objects.all())
+        stamps.append(tombstones.aggregate(last=Max("deleted_at"))["last"])
+        stamps = [stamp for stamp in stamps if stamp is not None]
+        return count, max(stamps) if stamps else None
+
+    def get_not_modified_response(self, request, *querysets):
+        """Return a 304 response if the client's copy of ``querysets`` is current
+
+        The validators are derived from the row counts and newest timestamps,
+        so no serializer work happens before the short-circuit.
+        """
+        return self.evaluate_preconditions(request, *self.get_version(*querysets))
+
+    def evaluate_preconditions(self, request, count, last_modified):
+        """Compute validators and check them against the request headers
+
+        No validators are issued while the newest change is inside the sync
+        lag, since an older write may still commit without moving either the
+        count or the newest timestamp.
+        """
+        self.etag = None
+        if last_modified is not None and last_modified > self.get_sync_cutoff():
+            return None
+
+        stamp = last_modified.timestamp() if last_modified else None
+        version = "|".join(
+            [self.action, str(count), str(stamp), request.get_full_path()]
+        )
+        self.etag = quote_etag(hashlib.md5(version.encode()).hexdigest())
+        # If-Modified-Since has whole-second precision
+        self.last_modified = int(stamp) if stamp is not None else None
+        return get_conditional_response(
+            request, etag=self.etag, last_modified=self.last_modified
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Attach cache validators computed for conditional GET requests"""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "etag", None) and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            if self.last_modified is not None:
+                response["Last-Modified"] = http_date(self.last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """List features, honouring conditional GET headers"""
+        count, last_modified = self.get_version(*self.get_tiers())
+        not_modified = self.evaluate_preconditions(request, count, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        # The paginator reuses the count instead of running its own COUNT(*)
+        self.row_count = count
+        return super().list(request, *args, **kwargs)
+
+    def get_object(self):
+        """Return the feature, skipping the lookup for votes on cached features
+
+        Votes are applied with an atomic update, so a cached feature only
+        needs its primary key; a concurrent delete surfaces as a 404.
+        """
+        pk = int(self.kwargs["pk"])
+        if self.action in ["upvote", "downvote"] and self.get_cached(pk):
+            return Feature(pk=pk)
+        try:
+            return super().get_object()
+        except Http404:
+            if self.action == "retrieve" and self.include_archived():
+                archived = self.scope_to_board(ArchivedFeature.objects.all())
+                return get_object_or_404(archived, pk=pk)
+            raise
+
+    def get_cached(self, pk):
+        """Return the cached representation of a feature on the current board"""
+        data = get_cached_feature(pk)
+        board = self.get_board()
+        if data is not None and board is not None and data["board"] != board.pk:
+            return None
+        return data
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a feature from the object cache, falling back to the DB"""
+        pk = int(kwargs["pk"])
+        data = self.get_cached(pk)
+        if data is None:
+            generation = get_feature_generation(pk)
+            instance = self.get_object()
+            data = self.get_serializer(instance, fields=None).data
+            if isinstance(instance, Feature):
+                cache_feature(pk, data, generation)
+
+        not_modified = self.evaluate_preconditions(
+            request, 1, parse_datetime(data["updated_at"])
+        )
+        if not_modified is not None:
+            return not_modified
+
+        fields = self.get_requested_fields()
+        if fields is not None:
+            data = {name: data[name] for name in fields}
+        return Response(data)
+
+    def save_feature(self, serializer, **kwargs):
+        """Save a validated feature serializer, mapping title races to a 400"""
+        try:
+            return serializer.save(**kwargs)
+        except IntegrityError:
+            # A concurrent request took the same title after validation
+            raise ValidationError(
+                {"title": ["A feature with this title already exists."]}
+            )
+
     def create(self, request, *args, **kwargs):
         """Create a new feature"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        feature = serializer.save()
+        feature = self.save_feature(serializer, board=serializer.context["board"])
 
         response_serializer = FeatureSerializer(feature)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -49,16 +326,21 @@ class FeatureViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        feature = serializer.save()
+        feature = self.save_feature(serializer)
+        # The instance was loaded before the save; report the current count
+        feature.refresh_from_db(fields=["votes"])
 
         response_serializer = FeatureSerializer(feature)
         return Response(response_serializer.data)
 
-    @action(detail=True, methods=["post"])
-    def upvote(self, request, pk=None):
+    @action(detail=True, methods=["post"], throttle_classes=[VoteRateThrottle])
+    def upvote(self, request, pk=None, **kwargs):
         """Upvote a feature"""
         feature = self.get_object()
-        feature.upvote()
+        try:
+            feature.upvote()
+        except Feature.DoesNotExist:
+            raise Http404
         return Response(
             {
                 "id": feature.id,
@@ -67,11 +349,14 @@ class FeatureViewSet(viewsets.ModelViewSet):
             }
         )
 
-    @action(detail=True, methods=["post"])
-    def downvote(self, request, pk=None):
+    @action(detail=True, methods=["post"], throttle_classes=[VoteRateThrottle])
+    def downvote(self, request, pk=None, **kwargs):
         """Downvote a feature"""
         feature = self.get_object()
-        feature.downvote()
+        try:
+            feature.downvote()
+        except Feature.DoesNotExist:
+            raise Http404
         return Response(
             {
                 "id": feature.id,
@@ -81,18 +366,189 @@ class FeatureViewSet(viewsets.ModelViewSet):
         )
 
     @action(detail=False, methods=["get"])
-    def top_voted(self, request):
+    def top_voted(self, request, **kwargs):
         """Get top voted features"""
+        features = self.scope_to_board(Feature.objects.all())
+        not_modified = self.get_not_modified_response(request, features)
+        if not_modified is not None:
+            return not_modified
+
         limit = int(request.query_params.get("limit", 10))
-        features = Feature.objects.order_by("-votes")[:limit]
-        serializer = FeatureSerializer(features, many=True)
+        features = features.order_by("-votes")
+        features = self.apply_sparse_fieldset(features)[:limit]
+        serializer = self.get_serializer(features, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
-    def recent(self, request):
+    def recent(self, request, **kwargs):
         """Get recently created features"""
+        features = self.scope_to_board(Feature.objects.all())
+        not_modified = self.get_not_modified_response(request, features)
+        if not_modified is not None:
+            return not_modified
+
         limit = int(request.query_params.get("limit", 10))
-        features = Feature.objects.order_by("-created_at")[:limit]
-        serializer = FeatureSerializer(features, many=True)
+        features = features.order_by("-created_at")
+        features = self.apply_sparse_fieldset(features)[:limit]
+        serializer = self.get_serializer(features, many=True)
         return Response(serializer.data)
 
+    def get_limit(self, name, default):
+        """Parse a positive, bounded section limit from the query string"""
+        value = self.request.query_params.get(name, default)
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            raise ValidationError({name: "A valid integer is required."})
+        if not 0 < limit <= self.dashboard_max_limit:
+            raise ValidationError(
+                {name: f"Must be between 1 and {self.dashboard_max_limit}."}
+            )
+        return limit
+
+    @action(detail=False, methods=["get"])
+    def dashboard(self, request, **kwargs):
+        """Get the list page, top voted and recent features in one response"""
+        top_limit = self.get_limit("top_limit", 10)
+        recent_limit = self.get_limit("recent_limit", 10)
+        features = self.scope_to_board(Feature.objects.all())
+        not_modified = self.get_not_modified_response(request, features)
+        if not_modified is not None:
+            return not_modified
+
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+
+        # Both leaderboards are fetched with a single UNION ALL query
+        leaderboard = self.apply_sparse_fieldset(features, "votes", "created_at")
+        top_voted = leaderboard.annotate(section=Value("top_voted")).order_by(
+            "-votes", "-created_at"
+        )[:top_limit]
+        recent = leaderboard.annotate(section=Value("recent")).order_by("-created_at")[
+            :recent_limit
+        ]
+        sections = {"top_voted": [], "recent": []}
+        for feature in top_voted.union(recent, all=True):
+            sections[feature.section].append(feature)
+        sections["top_voted"].sort(key=lambda f: (f.votes, f.created_at), reverse=True)
+        sections["recent"].sort(key=lambda f: f.created_at, reverse=True)
+
+        # Serialize each distinct feature once and share it between sections
+        unique = {}
+        for feature in [*page, *sections["top_voted"], *sections["recent"]]:
+            unique.setdefault(feature.pk, feature)
+        serializer = self.get_serializer(list(unique.values()), many=True)
+        data = {
+            feature.pk: item for feature, item in zip(unique.values(), serializer.data)
+        }
+
+        return Response(
+            {
+                "features": self.get_paginated_response(
+                    [data[feature.pk] for feature in page]
+                ).data,
+                "top_voted": [data[f.pk] for f in sections["top_voted"]],
+                "recent": [data[f.pk] for f in sections["recent"]],
+            }
+        )
+
+    def get_sync_cutoff(self):
+        """Return the newest change time that a sync token may move past
+
+        Change times are stamped before the write commits, so a change can
+        become visible after a newer one. Anything stamped more than
+        ``FEATURE_SYNC_LAG`` seconds ago is assumed to have committed.
+        """
+        return timezone.now() - timedelta(seconds=settings.FEATURE_SYNC_LAG)
+
+    def parse_sync_token(self, token):
+        """Parse a ``since`` token into feature and tombstone cursors"""
+        if not token:
+            return None, None
+        try:
+            values = [int(value) for value in token.split(".")]
+            if len(values) == 4:
+                return (
+                    (SYNC_EPOCH + timedelta(microseconds=values[0]), values[1]),
+                    (SYNC_EPOCH + timedelta(microseconds=values[2]), values[3]),
+                )
+        except (ValueError, OverflowError):
+            pass
+
+        # Tokens issued before cursors carried ids were plain timestamps
+        try:
+            since = parse_datetime(token)
+        except ValueError:
+            # Well formed, but not a real date
+            since = None
+        if since is None:
+            raise ValidationError({"since": "Invalid sync token."})
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since, dt_timezone.utc)
+        return (since, 0), (since, 0)
+
+    def make_sync_token(self, *cursors):
+        """Encode (time, id) cursors as a URL-safe token"""
+        if all(cursor is None for cursor in cursors):
+            return None
+        values = []
+        for stamp, pk in [cursor or (SYNC_EPOCH, 0) for cursor in cursors]:
+            values += [(stamp - SYNC_EPOCH) // timedelta(microseconds=1), pk]
+        return ".".join(str(value) for value in values)
+
+    def read_changes(self, queryset, field, cursor, cutoff):
+        """Read the page of ``queryset`` after ``cursor`` in (``field``, id) order
+
+        Return the rows, the cursor to resume from and whether more rows
+        follow. The cursor only advances over rows stamped before ``cutoff``;
+        newer rows are returned now and again by the next request.
+        """
+        if cursor is not None:
+            stamp, pk = cursor
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": stamp}) | Q(**{field: stamp, "id__gt": pk})
+            )
+        rows = list(queryset.order_by(field, "id")[: self.changes_page_size + 1])
+        has_more = len(rows) > self.changes_page_size
+        rows = rows[: self.changes_page_size]
+        for row in rows:
+            if getattr(row, field) > cutoff:
+                # The rest of the page and anything after it is also too new
+                has_more = False
+                break
+            cursor = (getattr(row, field), row.id)
+        return rows, cursor, has_more
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request, **kwargs):
+        """Get features created, changed or deleted since a sync token
+
+        Changes may be delivered more than once, so clients apply them
+        idempotently.
+        """
+        feature_cursor, tombstone_cursor = self.parse_sync_token(
+            request.query_params.get("since")
+        )
+        cutoff = self.get_sync_cutoff()
+
+        changed, feature_cursor, more_changed = self.read_changes(
+            self.scope_to_board(Feature.objects.all()),
+            "updated_at",
+            feature_cursor,
+            cutoff,
+        )
+        tombstones, tombstone_cursor, more_deleted = self.read_changes(
+            self.scope_to_board(FeatureTombstone.objects.all()),
+            "deleted_at",
+            tombstone_cursor,
+            cutoff,
+        )
+
+        serializer = FeatureSerializer(changed, many=True)
+        return Response(
+            {
+                "changed": serializer.data,
+                "deleted": [tombstone.feature_id for tombstone in tombstones],
+                "since": self.make_sync_token(feature_cursor, tombstone_cursor),
+                "has_more": more_changed or more_deleted,
+            }
+        )
@@ -0,0 +1,49 @@
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+
+from .cache import cache_feature, get_feature_generation
+from .models import Feature
+from .serializers import FeatureSerializer
+
+
+def warm_up():
+    """Prime per-process state before the server starts accepting traffic
+
+    Run once in the master process before workers are forked, so every
+    worker inherits the populated URL resolver and model metadata instead
+    of paying for them on its first requests.
+    """
+    # Importing the URLconf imports the views and compiles every route
+    get_resolver().reverse_dict
+
+    # Fill the cached field maps and relation trees on every model's _meta;
+    # serializer fields are rebuilt per instance, so there's nothing to keep
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+    # Database connections must not be shared with forked workers
+    connections.close_all()
+
+
+def prime_feature_cache():
+    """Cache the top ``WARMUP_FEATURES`` features
+
+    Run in each worker after it is forked, so a per-process cache is filled
+    with current data rather than inherited from the master.
+    """
+    if not settings.FEATURE_CACHE_ENABLED:
+        return
+
+    # Take each feature's generation before reading it, as retrieve does
+    top = Feature.objects.order_by("-votes", "-created_at")[: settings.WARMUP_FEATURES]
+    generations = {
+        pk: get_feature_generation(pk) for pk in top.values_list("pk", flat=True)
+    }
+    features = Feature.objects.filter(pk__in=generations)
+    for data in FeatureSerializer(features, many=True).data:
+        cache_feature(data["id"], data, generations[data["id"]])
+
+    # Request threads open their own connections; don't leave this one idle
+    connections.close_all()
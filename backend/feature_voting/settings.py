@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -13,9 +13,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = "django-insecure-b_s(^-&6tmhv@#k3i*kup*fm%b=$3#0$f5#*&@nyx$kdhb38$z"
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = config("DEBUG", default=True, cast=bool)
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="", cast=Csv())
 
 
 # Application definition
@@ -68,6 +68,9 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default="postgres123"),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
+        # Keep connections open between requests; set to 0 under ASGI workers
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 # Password validation
@@ -117,9 +120,18 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",  # No authentication required
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.FeaturePagination",
     "PAGE_SIZE": 20,
+    # Proxies in front of the app; X-Forwarded-For is ignored when 0
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
+    "DEFAULT_THROTTLE_RATES": {
+        # Token bucket capacity/refill for votes, see core.throttling
+        "vote_client": config("VOTE_CLIENT_RATE", default="60/min"),
+        "vote_feature": config("VOTE_FEATURE_RATE", default="600/min"),
+    },
 }
+# "local" keeps vote throttle buckets per process, "cache" shares them
+VOTE_THROTTLE_STORE = config("VOTE_THROTTLE_STORE", default="local")
 
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
@@ -127,3 +139,28 @@ CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:3000",
 ]
 CORS_ALLOW_ALL_ORIGINS = config("DEBUG", default=True, cast=bool)
+
+# Cache
+CACHE_BACKEND = config(
+    "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+)
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default="feature-voting"),
+    }
+}
+if CACHE_BACKEND.endswith("LocMemCache"):
+    # Redis and Memcached clients reject unknown options
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=1000, cast=int),
+    }
+# Serve feature details from the cache; gunicorn.conf.py turns this off when
+# several workers would each hold a private, unsynchronized LocMemCache
+FEATURE_CACHE_ENABLED = config("FEATURE_CACHE_ENABLED", default=True, cast=bool)
+FEATURE_CACHE_TIMEOUT = config("FEATURE_CACHE_TIMEOUT", default=300, cast=int)
+# Seconds a change may take from being stamped to committing; sync tokens
+# and cache validators stay this far behind the clock
+FEATURE_SYNC_LAG = config("FEATURE_SYNC_LAG", default=2, cast=int)
+# Number of top voted features primed into the cache by core.warmup
+WARMUP_FEATURES = config("WARMUP_FEATURES", default=100, cast=int)
@@ -0,0 +1,80 @@
+"""Gunicorn configuration for serving the API in production
+
+Run with ``gunicorn --config gunicorn.conf.py``. ``SERVER_MODE`` selects
+threaded WSGI workers (default) or uvicorn ASGI workers.
+"""
+
+import multiprocessing
+import os
+
+import decouple
+
+SERVER_MODE = decouple.config("SERVER_MODE", default="wsgi")
+
+bind = decouple.config("BIND", default="0.0.0.0:8000")
+workers = decouple.config(
+    "WEB_CONCURRENCY", default=multiprocessing.cpu_count() * 2 + 1, cast=int
+)
+preload_app = True
+timeout = decouple.config("GUNICORN_TIMEOUT", default=30, cast=int)
+keepalive = 5
+max_requests = decouple.config("GUNICORN_MAX_REQUESTS", default=10000, cast=int)
+max_requests_jitter = max_requests // 10
+accesslog = "-"
+
+# A vote invalidates the feature cache of the worker that handled it only,
+# so a per-process cache would serve stale features from the others
+PER_PROCESS_CACHE = workers > 1 and decouple.config(
+    "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+).endswith("LocMemCache")
+if PER_PROCESS_CACHE:
+    os.environ["FEATURE_CACHE_ENABLED"] = "False"
+
+if SERVER_MODE == "asgi":
+    wsgi_app = "feature_voting.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    # Django can't reuse persistent connections across ASGI requests
+    os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+else:
+    wsgi_app = "feature_voting.wsgi:application"
+    worker_class = "gthread"
+    threads = decouple.config("GUNICORN_THREADS", default=4, cast=int)
+
+
+def when_ready(server):
+    """Warm up the preloaded application before any worker is forked"""
+    from django.conf import settings
+
+    from core.warmup import warm_up
+
+    # -w and GUNICORN_CMD_ARGS are applied after this file was read
+    if (
+        server.cfg.workers > 1
+        and settings.CACHE_BACKEND.endswith("LocMemCache")
+        and settings.FEATURE_CACHE_ENABLED
+    ):
+        raise RuntimeError(
+            f"{server.cfg.workers} workers can't share a LocMemCache feature "
+            "cache. Set the worker count with WEB_CONCURRENCY, or configure a "
+            "shared CACHE_BACKEND."
+        )
+    if PER_PROCESS_CACHE:
+        server.log.warning(
+            "CACHE_BACKEND is private to each of the %s workers: the feature "
+            "cache is disabled, and /v1/metrics/ and VOTE_THROTTLE_STORE=cache "
+            "only see one worker. Configure a shared cache backend.",
+            workers,
+        )
+    warm_up()
+    server.log.info("Application warmed up")
+
+
+def post_worker_init(worker):
+    """Prime the feature cache in each worker once it has been forked
+
+    Priming the master instead would hand every respawned worker the
+    startup snapshot of a per-process cache.
+    """
+    from core.warmup import prime_feature_cache
+
+    prime_feature_cache()
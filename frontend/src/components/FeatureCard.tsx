@@ -1,11 +1,11 @@
 import React from "react";
 import { featureService } from "../services/api";
-import { Feature } from "../types/Feature";
+import { FeatureCardData } from "../types/Feature";
 
 interface FeatureCardProps {
-  feature: Feature;
+  feature: FeatureCardData;
   onVoteUpdate: (id: number, newVotes: number) => void;
-  onEdit?: (feature: Feature) => void;
+  onEdit?: (feature: FeatureCardData) => void;
   onDelete?: (id: number) => void;
   showActions?: boolean;
 }
@@ -57,7 +57,7 @@ const FeatureCard: React.FC<FeatureCardProps> = ({
         </div>
       </div>
 
-      <p className="text-gray-600 mb-4">{feature.description}</p>
+      <p className="text-gray-600 mb-4">{feature.summary}</p>
 
       <div className="flex justify-between items-center">
         <div className="flex space-x-2">
@@ -1,12 +1,12 @@
 import React, { useState, useEffect } from "react";
 import { Link, useNavigate } from "react-router-dom";
-import { Feature } from "../types/Feature";
+import { FeatureCardData } from "../types/Feature";
 import { featureService } from "../services/api";
 import FeatureCard from "../components/FeatureCard";
 import SearchBar from "../components/SearchBar";
 
 const FeatureList: React.FC = () => {
-  const [features, setFeatures] = useState<Feature[]>([]);
+  const [features, setFeatures] = useState<FeatureCardData[]>([]);
   const [loading, setLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState("");
   const navigate = useNavigate();
@@ -35,7 +35,7 @@ const FeatureList: React.FC = () => {
     );
   };
 
-  const handleEdit = (feature: Feature) => {
+  const handleEdit = (feature: FeatureCardData) => {
     navigate(`/features/${feature.id}/edit`);
   };
 
@@ -2,6 +2,8 @@ import axios from "axios";
 import {
     CreateFeatureRequest,
     Feature,
+    FeatureChangesResponse,
+    FeatureDashboardResponse,
     FeatureListResponse,
     UpdateFeatureRequest
 } from "../types/Feature";
@@ -16,11 +18,14 @@ export const api = axios.create({
   },
 });
 
+// Fields needed to render a FeatureCard; skips the full description
+const CARD_FIELDS = "id,title,summary,votes,created_at";
+
 export const featureService = {
   getFeatures: (search?: string, page?: number): Promise<FeatureListResponse> =>
     api
       .get("/features/", {
-        params: { search, page },
+        params: { search, page, fields: CARD_FIELDS },
       })
       .then((res) => res.data),
 
@@ -48,4 +53,26 @@ export const featureService = {
 
   getRecent: (limit?: number): Promise<Feature[]> =>
     api.get("/features/recent/", { params: { limit } }).then((res) => res.data),
+
+  getDashboard: (
+    search?: string,
+    page?: number,
+    limits?: { top?: number; recent?: number },
+  ): Promise<FeatureDashboardResponse> =>
+    api
+      .get("/features/dashboard/", {
+        params: {
+          search,
+          page,
+          fields: CARD_FIELDS,
+          top_limit: limits?.top,
+          recent_limit: limits?.recent,
+        },
+      })
+      .then((res) => res.data),
+
+  getChanges: (since?: string | null): Promise<FeatureChangesResponse> =>
+    api
+      .get("/features/changes/", { params: { since: since ?? undefined } })
+      .then((res) => res.data),
 };
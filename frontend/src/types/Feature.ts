@@ -1,12 +1,19 @@
 export interface Feature {
   id: number;
+  board: number;
   title: string;
   description: string;
+  summary: string;
   votes: number;
   created_at: string;
   updated_at: string;
 }
 
+export type FeatureCardData = Pick<
+  Feature,
+  "id" | "title" | "summary" | "votes" | "created_at"
+>;
+
 export interface CreateFeatureRequest {
   title: string;
   description: string;
@@ -21,5 +28,18 @@ export interface FeatureListResponse {
   count: number;
   next: boolean;
   previous: boolean;
-  results: Feature[];
+  results: FeatureCardData[];
+}
+
+export interface FeatureDashboardResponse {
+  features: FeatureListResponse;
+  top_voted: FeatureCardData[];
+  recent: FeatureCardData[];
+}
+
+export interface FeatureChangesResponse {
+  changed: Feature[];
+  deleted: number[];
+  since: string | null;
+  has_more: boolean;
 }